@@ -53,6 +53,14 @@ def test_account_string(asset):
     asset.set_balance(120)
     assert "$120.00" in str(asset), str(asset)
 
+    asset.debit(5)
+    assert "$125.00" in str(asset), "Cached string not refreshed after posting"
+
+
+def test_account_repr():
+    """Checks the account repr mirrors its constructor"""
+    assert repr(Income("Sales", 12)) == "Income(name='Sales', starting_balance=12.0)"
+
 
 def test_account_types():
     """Checks the Account typing design"""
@@ -89,6 +97,63 @@ def test_debit_credit(asset, expense, income):
     assert income.balance == 25
 
 
+def test_account_subclass_posting():
+    """Test that custom debit/credit methods on account subclasses are kept"""
+
+    class CappedAsset(Asset):
+        def debit(self, amount):
+            super().debit(min(amount, 10))
+
+    class SubCappedAsset(CappedAsset):
+        pass
+
+    account = SubCappedAsset("Capped")
+    account.debit(25)
+    account.credit(5)
+
+    assert account.balance == 5
+
+
+def test_account_custom_op_posting():
+    """Test that account subclasses with their own operators use them to post"""
+
+    class DoubleAsset(Asset):
+        debit_op = staticmethod(lambda balance, amount: balance + 2 * amount)
+        credit_op = staticmethod(lambda balance, amount: balance - 2 * amount)
+
+    account = DoubleAsset("Double")
+    account.debit(5)
+    assert account.balance == 10
+
+    account.credit(2)
+    assert account.balance == 6
+
+
+def test_account_unhashable_op():
+    """Test that account subclasses accept unhashable operator callables"""
+
+    class UnhashableOp:
+        __hash__ = None
+
+        def __call__(self, balance, amount):
+            return balance + amount
+
+    class CallableAsset(Asset):
+        debit_op = UnhashableOp()
+
+    account = CallableAsset("Callable")
+    account.debit(5)
+    assert account.balance == 5
+
+
+def test_account_posting_docs():
+    """Test that the specialized posting methods keep the debit/credit docs"""
+    assert Asset.debit.__name__ == "debit"
+    assert Asset.debit.__doc__ == Account.debit.__doc__
+    assert Liability.credit.__name__ == "credit"
+    assert Liability.credit.__doc__ == Account.credit.__doc__
+
+
 def test_coa_account_management(coa, asset):
     """Test the account management handling of the COA"""
     assert len(coa) == 0, "Non empty accounts initialized in COA"
@@ -125,6 +190,20 @@ def test_coa_account_management(coa, asset):
     assert coa.has_account(new_equity)
 
 
+def test_coa_views_read_only(coa, asset):
+    """Ensure the per-type account views cannot drift from the chart index"""
+    coa.add_account(asset)
+
+    with pytest.raises(TypeError):
+        coa.accounts["ASSET"]["Other"] = asset
+
+    with pytest.raises(TypeError):
+        coa.by_type("asset")["Other"] = asset
+
+    assert len(coa) == 1
+    assert coa.accounts["ASSET"][asset.name] is asset
+
+
 def test_coa_create_account(coa):
     """Test the create_account method on the ChartOfAccounts"""
     account = coa.create_and_add_account(
@@ -154,6 +233,29 @@ def test_coa_create_account(coa):
     assert len(coa) == 0, "Should not have added bad account"
 
 
+def test_coa_account_type_spellings(coa, income):
+    """Test that account types resolve from strings in any case"""
+    coa.add_account(income)
+
+    for spelling in ("INCOME", "income", "Income", "iNcOmE", AccountType.INCOME):
+        assert coa.by_type(spelling) == {income.name: income}, spelling
+
+    assert coa.by_type(3) is None, "Plain ints should not resolve to an AccountType"
+
+
+def test_coa_create_registered_account(coa, monkeypatch):
+    """Test that create_and_add_account uses classes registered in accounts_by_type"""
+
+    class CashAccount(Asset):
+        pass
+
+    monkeypatch.setitem(accounts_by_type, AccountType.ASSET, CashAccount)
+
+    account = coa.create_and_add_account("asset", "Cash")
+    assert type(account) is CashAccount
+    assert coa.has_account(account)
+
+
 def test_coa_by_name_and_type(coa, asset):
     """Tests the COA by_name_and_type method"""
     coa.add_account(asset)
@@ -179,6 +281,10 @@ def test_transaction(filled_transaction):
     assert filled_transaction.n_entries == 2, "N_entries not correct"
     assert filled_transaction.is_balanced, "Balanced transaction shown as unbalanced"
 
+    with pytest.raises(AttributeError):
+        filled_transaction.debits[0].amount = 50
+    assert filled_transaction.total_debits == 20, "Frozen item amount was changed"
+
     asset = filled_transaction.credits[0].account
     expense = filled_transaction.debits[0].account
 
@@ -201,6 +307,22 @@ def test_unbalanced_transaction(transaction, asset):
     assert asset.balance == 0
 
 
+def test_transaction_float_balance(transaction, asset, expense):
+    """Ensure float rounding does not unbalance an otherwise balanced transaction"""
+    transaction.add_debit(expense, 0.1)
+    transaction.add_debit(expense, 0.2)
+    transaction.add_credit(asset, 0.3)
+
+    assert transaction.is_balanced
+
+    transaction.clear()
+    transaction.add_debit(expense, 1e7 + 0.1)
+    transaction.add_debit(expense, 0.2)
+    transaction.add_credit(asset, 1e7 + 0.3)
+
+    assert transaction.is_balanced, "Large amounts should balance within tolerance"
+
+
 def test_transaction_by_account(transaction, asset, expense):
     """Test adding a transaction by account and amount rather that a dedicated TransactionItem"""
 
@@ -211,6 +333,77 @@ def test_transaction_by_account(transaction, asset, expense):
     assert transaction.is_balanced
 
 
+def test_transaction_custom_account(transaction, expense):
+    """Test posting a transaction to an account class with its own operators"""
+
+    class Custom(Account):
+        account_type = AccountType.ASSET
+        debit_op = float.__add__
+        credit_op = staticmethod(lambda balance, amount: balance - amount)
+
+    account = Custom("Custom", 50)
+    transaction.add_debit(expense, 20)
+    transaction.add_credit(account, 20)
+
+    for _ in transaction.call():
+        pass
+
+    assert account.balance == 30
+    assert expense.balance == 20
+    assert "Custom[ASSET" in str(account), str(account)
+
+
+def test_transaction_overridden_posting(transaction, income):
+    """Test that transactions post through debit/credit overridden by a subclass"""
+
+    class CappedAsset(Asset):
+        def debit(self, amount):
+            super().debit(min(amount, 10))
+
+    account = CappedAsset("Capped")
+    transaction.add_debit(account, 25)
+    transaction.add_credit(income, 25)
+
+    for _ in transaction.call():
+        pass
+
+    assert account.balance == 10
+    assert income.balance == 25
+
+
+def test_transaction_posting_order(transaction, income):
+    """Test that credits post before debits for balance dependent overrides"""
+
+    class FlooredAsset(Asset):
+        def credit(self, amount):
+            super().credit(min(amount, self.balance))
+
+    account = FlooredAsset("Floored")
+    transaction.add_debit(account, 10)
+    transaction.add_credit(account, 10)
+
+    for _ in transaction.call():
+        pass
+
+    assert account.balance == 10
+
+
+def test_transaction_fast_paths(transaction, asset, expense):
+    """Test the unvalidated add methods for accounts and transaction items"""
+
+    transaction.add_debit_account(expense, 30)
+    transaction.add_credit_item(TransactionItem(asset, 30))
+
+    assert transaction.n_entries == 2
+    assert transaction.is_balanced
+
+    transaction.add_debit_item(TransactionItem(asset, 10))
+    transaction.add_credit_account(expense, 10)
+
+    assert transaction.total_debits == 40
+    assert transaction.total_credits == 40
+
+
 def test_bad_transaction(transaction, asset):
     """Tests bad formation of transactions"""
 
@@ -231,3 +424,17 @@ def test_bad_transaction(transaction, asset):
     transaction.add_credit(asset)
 
     assert transaction.n_entries == 0
+
+
+def test_post_many(asset, expense, income):
+    """Test that batched posting nets entries per account"""
+    asset.set_balance(100)
+
+    post_many(
+        debits=[TransactionItem(expense, 20), TransactionItem(asset, 30)],
+        credits=[TransactionItem(asset, 20), TransactionItem(income, 30)],
+    )
+
+    assert asset.balance == 110
+    assert expense.balance == 20
+    assert income.balance == 30
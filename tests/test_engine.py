@@ -1,6 +1,13 @@
 """Test the Event engine"""
 import pytest
-from tfin.engine import Engine, EngineState, Event, EventError, StopEngineError
+from tfin.engine import (
+    STOP,
+    Engine,
+    EngineState,
+    Event,
+    EventError,
+    StopEngineError,
+)
 
 
 @pytest.fixture
@@ -22,13 +29,41 @@ def test_engine_scheduling(engine):
     event = event_factory(timestep=3)
     engine.schedule(event)
     assert len(engine.queue) == 1, "Queue still empty"
-    assert engine.queue[0].event == event
-    assert engine.queue[0].timestep == 3
+    assert engine.queue.peek() == (3, event)
 
     event2 = event_factory(timestep=1)
     engine.schedule(event2)
 
-    assert engine.queue[0].event == event2, "Queue priority not being enforced"
+    assert engine.queue.peek() == (1, event2), "Queue priority not being enforced"
+
+
+def test_engine_scheduling_fifo(engine):
+    """Tests that events scheduled at the same timestep run in insertion order"""
+    order = []
+
+    class RecordEvent(Event):
+        def call(self, ctx=None):
+            order.append(self.name)
+            yield None
+
+    for i in range(5):
+        engine.schedule(event_factory(RecordEvent, timestep=1, name=f"Event {i}"))
+
+    engine.run()
+
+    assert order == [f"Event {i}" for i in range(5)], order
+
+
+def test_event_ordering():
+    """Tests that events order by timestep and do not share a default data dict"""
+    events = [event_factory(timestep=t, data=None) for t in (3, 1, 2)]
+    assert [e.timestep for e in sorted(events)] == [1, 2, 3]
+
+    events[0].data["key"] = "value"
+    assert events[1].data == {}, "Events should not share their default data"
+
+    events[2].data = {"replaced": True}
+    assert events[2].data == {"replaced": True}, "Event data setter not applied"
 
 
 def test_engine_schedule_bad_input(engine):
@@ -39,6 +74,30 @@ def test_engine_schedule_bad_input(engine):
     assert len(engine.queue) == 0, "Bad data structure added to queue"
 
 
+def test_engine_schedule_event_like(engine):
+    """Ensure objects that only implement the EventLike interface can be scheduled"""
+
+    class DuckEvent:
+        timestep = 4
+        name = "Duck Event"
+
+        def call(self, ctx=None):
+            yield None
+
+    event = DuckEvent()
+    engine.schedule(event)
+    assert engine.queue.peek() == (4, event)
+
+    class NamelessEvent:
+        timestep = 5
+
+        def call(self, ctx=None):
+            yield None
+
+    engine.schedule(NamelessEvent())
+    assert len(engine.queue) == 1, "Objects without a name are not EventLike"
+
+
 def test_engine_init(engine):
     """Test the engine is initialized correctly before setting up the environment"""
     assert engine.is_state(EngineState.WAITING), "Engine state should init to WAITING"
@@ -86,7 +145,7 @@ def test_engine_stopped_by_event(engine):
     """Tests when an event forces the engine to stop"""
 
     class StopEvent(Event):
-        def call(self):
+        def call(self, ctx=None):
             raise StopEngineError(self, "I've been a bad event")
 
     engine.schedule(event_factory(StopEvent))
@@ -97,11 +156,29 @@ def test_engine_stopped_by_event(engine):
     ), "StopSimulationError did not trigger an engine STOP"
 
 
+def test_engine_stopped_by_sentinel(engine):
+    """Tests when an event yields STOP to stop the engine"""
+
+    class StopEvent(Event):
+        def call(self, ctx=None):
+            yield EmptyEvent(self.timestep + 1, "Scheduled before stop")
+            yield STOP
+            yield EmptyEvent(self.timestep + 2, "Never scheduled")
+
+    engine.schedule(event_factory(StopEvent, timestep=3))
+    engine.run()
+
+    assert engine.state == EngineState.STOPPED, "STOP did not trigger an engine STOP"
+    assert engine.now == 3
+    assert len(engine.queue) == 1, "Only events yielded before STOP are scheduled"
+    assert repr(STOP) == "STOP"
+
+
 def test_engine_abort(engine):
     """Tests status when an event purposefully errors out"""
 
     class ErroredEvent(Event):
-        def call(self):
+        def call(self, ctx=None):
             raise EventError(self, "This is a general error")
 
     engine.schedule(event_factory(ErroredEvent))
@@ -130,7 +207,7 @@ def test_engine_consuming_events(engine):
     class SimpleEvent(Event):
         """Event that yields several empty events"""
 
-        def call(self):
+        def call(self, ctx=None):
             for i in range(3):
                 yield EmptyEvent(self.timestep + 2 * i, f"Yielded Event {i}")
 
@@ -139,3 +216,53 @@ def test_engine_consuming_events(engine):
 
     assert engine.state == EngineState.FINISHED, "Engine is in wrong state"
     assert engine.now == 6, f"Simulation should be at timestep 6, not {engine.now}"
+
+
+def test_engine_schedule_many(engine):
+    """Test batch scheduling keeps timestep priority and FIFO order"""
+    engine.schedule(event_factory(timestep=5, name="Existing"))
+
+    events = [event_factory(timestep=t, name=f"Event {t}") for t in (3, 1, 4, 1)]
+    engine.schedule_many(events + ["Not an event"])
+
+    assert len(engine.queue) == 5, "Bad input should be dropped from the batch"
+
+    popped = [engine.queue.pop() for _ in range(5)]
+    assert [t for t, _ in popped] == [1, 1, 3, 4, 5]
+    assert popped[0][1] is events[1] and popped[1][1] is events[3]
+
+
+def test_engine_consuming_event_list(engine):
+    """Test the engine consuming an event that returns its new events as a list"""
+
+    class FanOutEvent(Event):
+        """Event that returns several empty events at once"""
+
+        def call(self, ctx=None):
+            return [
+                EmptyEvent(self.timestep + i, f"Fanned Event {i}") for i in range(4)
+            ]
+
+    engine.schedule(FanOutEvent(1, "Top Event"))
+    engine.run()
+
+    assert engine.state == EngineState.FINISHED, "Engine is in wrong state"
+    assert engine.now == 4, f"Simulation should be at timestep 4, not {engine.now}"
+
+
+def test_engine_context(engine):
+    """Test the engine passes its simulation context to events"""
+    seen = []
+
+    class ContextEvent(Event):
+        def call(self, ctx=None):
+            seen.append((ctx.time, ctx.engine))
+            ctx.state["calls"] = ctx.state.get("calls", 0) + 1
+            yield None
+
+    engine.schedule(event_factory(ContextEvent, timestep=2))
+    engine.schedule(event_factory(ContextEvent, timestep=7))
+    engine.run()
+
+    assert seen == [(2, engine), (7, engine)], seen
+    assert engine.context.state["calls"] == 2
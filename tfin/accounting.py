@@ -1,7 +1,23 @@
 """Allows for an accounting style journal of accounts and transactions"""
+import functools
+import math
+import sys
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Callable, Dict, List, Optional, Type, Union
+from enum import IntEnum
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from .engine import Event
 
@@ -17,30 +33,58 @@ __all__ = [
     "ChartOfAccounts",
     "TransactionItem",
     "Transaction",
+    "post_many",
 ]
 
 
-class AccountType(Enum):
-    ASSET = auto()
-    LIABILITY = auto()
-    EQUITY = auto()
-    INCOME = auto()
-    EXPENSE = auto()
+class AccountType(IntEnum):
+    ASSET = 0
+    LIABILITY = 1
+    EQUITY = 2
+    INCOME = 3
+    EXPENSE = 4
 
 
+# Common spellings of the account type names, mapped to their AccountType
+_ACCOUNT_TYPE_MAP: Final[Dict[str, AccountType]] = {
+    spelling: t
+    for t in AccountType
+    for spelling in (t.name, t.name.lower(), t.name.capitalize())
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _to_account_type(account_type: str) -> Optional[AccountType]:
+    """Convert an account type name in any other case to an AccountType, None if invalid"""
+    return _ACCOUNT_TYPE_MAP.get(account_type.upper())
+
+
+# Relative and absolute tolerance between the debits and credits of a balanced
+# transaction
+_BALANCE_TOLERANCE: Final = 1e-9
+
 N = Union[float, int]  # Numeric type
 C = Callable[[float, float], float]  # Numeric callable operator type
 
 
-@dataclass
 class AccountBase:
-    """Account dataclass."""
+    """Account base class.
 
-    name: str
-    starting_balance: float = 0.0
+    Slotted rather than a dataclass to keep large charts of accounts small"""
 
-    def __post_init__(self):
-        self._balance = float(self.starting_balance)
+    __slots__ = (
+        "name",
+        "starting_balance",
+        "_balance",
+        "_str_cache",
+    )
+
+    def __init__(self, name: str, starting_balance: N = 0.0):
+        # Interned so chart of accounts lookups can short-circuit on identity
+        self.name = sys.intern(name) if type(name) is str else name
+        self.starting_balance = float(starting_balance)
+        self._balance = self.starting_balance
+        self._str_cache: Optional[Tuple[str, float, str]] = None
 
     @property
     def balance(self):
@@ -49,32 +93,141 @@ class AccountBase:
     def set_balance(self, amount: N):
         self._balance = float(amount)
 
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"(name={self.name!r}, starting_balance={self.starting_balance!r})"
+        )
+
     def __str__(self):
-        return f"{self.name}[{self.account_type.name} - ${self.balance:.2f}]"
+        # Cached against the name and balance it was formatted from, so posting
+        # does not have to invalidate it
+        cache = self._str_cache
+        if cache is None or cache[0] is not self.name or cache[1] != self._balance:
+            formatted = f"{self.name}[{self.account_type_name} - ${self._balance:.2f}]"
+            cache = self._str_cache = (self.name, self._balance, formatted)
+        return cache[2]
+
+
+def _make_posting_method(name: str, doc: str, subtract: bool) -> Callable:
+    """Build a debit/credit method with the balance operator inlined"""
+    if subtract:
+
+        def posting_method(self, amount: N):
+            self._balance = self._balance - (
+                amount if type(amount) is float else float(amount)
+            )
+
+    else:
+
+        def posting_method(self, amount: N):
+            self._balance = self._balance + (
+                amount if type(amount) is float else float(amount)
+            )
+
+    posting_method.__name__ = name
+    posting_method.__qualname__ = f"Account.{name}"
+    posting_method.__doc__ = doc
+    return posting_method
+
+
+_DEBIT_DOC = "Debit the account by an amount."
+_CREDIT_DOC = "Credit the account by an amount"
+
+# Specialized posting methods by (method name, operator), with the operator inlined
+_POSTING_METHODS: Final[Tuple[Tuple[str, C, Callable], ...]] = (
+    ("debit", float.__add__, _make_posting_method("debit", _DEBIT_DOC, False)),
+    ("debit", float.__sub__, _make_posting_method("debit", _DEBIT_DOC, True)),
+    ("credit", float.__add__, _make_posting_method("credit", _CREDIT_DOC, False)),
+    ("credit", float.__sub__, _make_posting_method("credit", _CREDIT_DOC, True)),
+)
+
+
+def _posting_method(method: str, op: Optional[C]) -> Optional[Callable]:
+    """The specialized posting method for an operator, looked up by identity as
+    user operators need not be hashable"""
+    for known_method, known_op, posting_method in _POSTING_METHODS:
+        if known_method == method and op is known_op:
+            return posting_method
+    return None
+
+
+def _is_posting_method(func: Callable) -> bool:
+    """Whether a function is one of the specialized posting methods"""
+    return any(func is posting_method for _, _, posting_method in _POSTING_METHODS)
+
+
+def _debit_sign(op: Optional[C]) -> Optional[float]:
+    """The sign a known debit operator applies to the balance, None if unknown"""
+    if op is float.__add__:
+        return 1.0
+    if op is float.__sub__:
+        return -1.0
+    return None
 
 
 class Account(AccountBase):
-    """Account abstract dataclass.
+    """Account abstract class.
 
     Do not instantiate directly.  It is useful, however, as a typing reference and
     for isinstance() checks"""
 
+    __slots__ = ()
+
     debit_op: C
     credit_op: C
+    # Sign a debit applies to the balance, credits apply the opposite.  None when the
+    # operators have no known sign or debit/credit are overridden, and the account
+    # then posts through debit()/credit()
+    debit_sign: Optional[float] = None
     account_type: AccountType
+    account_type_name: str  # Set from account_type when the class is defined
+
+    def __init_subclass__(cls, **kwargs):
+        """Specialize debit and credit for the operators of the subclass.
+
+        Subclasses with custom operators get the generic methods back, custom
+        debit/credit methods are left as is
+        """
+        super().__init_subclass__(**kwargs)
+        account_type = getattr(cls, "account_type", None)
+        if account_type is not None:
+            cls.account_type_name = account_type.name
+
+        for method, op_name in (("debit", "debit_op"), ("credit", "credit_op")):
+            generic = vars(Account)[method]
+            inherited = getattr(cls, method)
+            if inherited is generic or _is_posting_method(inherited):
+                posting_method = _posting_method(method, getattr(cls, op_name, None))
+                setattr(cls, method, posting_method or generic)
+
+        debit_sign = _debit_sign(getattr(cls, "debit_op", None))
+        credit_sign = _debit_sign(getattr(cls, "credit_op", None))
+        nettable = (
+            debit_sign is not None
+            and credit_sign == -debit_sign
+            and _is_posting_method(cls.debit)
+            and _is_posting_method(cls.credit)
+        )
+        cls.debit_sign = debit_sign if nettable else None
 
     def debit(self, amount: N):
         """Debit the account by an amount."""
-        self.set_balance(self.__class__.debit_op(self.balance, float(amount)))
+        self._balance = type(self).debit_op(
+            self._balance, amount if type(amount) is float else float(amount)
+        )
 
     def credit(self, amount: N):
         """Credit the account by an amount"""
-        self.set_balance(self.__class__.credit_op(self.balance, float(amount)))
+        self._balance = type(self).credit_op(
+            self._balance, amount if type(amount) is float else float(amount)
+        )
 
 
 class AssetLike:
     """Mixin to manage the asset like accounts wrt to the operation of debit and credit"""
 
+    __slots__ = ()
     debit_op = float.__add__
     credit_op = float.__sub__
 
@@ -82,6 +235,7 @@ class AssetLike:
 class LiabilityLike:
     """Mixin to manage the liability like accounts wrt to the operation of debit and credit"""
 
+    __slots__ = ()
     debit_op = float.__sub__
     credit_op = float.__add__
 
@@ -89,30 +243,40 @@ class LiabilityLike:
 class Asset(Account, AssetLike):
     """Asset Account"""
 
+    __slots__ = ()
+
     account_type = AccountType.ASSET
 
 
 class Liability(Account, LiabilityLike):
     """Liability Account"""
 
+    __slots__ = ()
+
     account_type = AccountType.LIABILITY
 
 
 class Equity(Account, LiabilityLike):
     """Equity Account"""
 
+    __slots__ = ()
+
     account_type = AccountType.EQUITY
 
 
 class Income(Account, LiabilityLike):
     """Income Account"""
 
+    __slots__ = ()
+
     account_type = AccountType.INCOME
 
 
 class Expense(Account, AssetLike):
     """Expense Account"""
 
+    __slots__ = ()
+
     account_type = AccountType.EXPENSE
 
 
@@ -124,19 +288,27 @@ accounts_by_type: Dict[AccountType, Type[Account]] = {
     AccountType.EXPENSE: Expense,
 }
 
+# The built-in concrete account classes, for fast exact type checks
+_ACCOUNT_TYPES: Final[FrozenSet[Type[Account]]] = frozenset(
+    {Asset, Liability, Equity, Income, Expense}
+)
+
 
 class ChartOfAccounts:
     """A chart of accounts that can manage and filter accounts"""
 
     def __init__(self):
 
-        self._accounts: Dict[str, Dict[str, Account]] = dict(
-            ((act_type.name, {}) for act_type in AccountType)
-        )
+        # Primary index, keyed by (account type, account name)
+        self._index: Dict[Tuple[AccountType, str], Account] = {}
+
+        # Secondary per-type view indexed by AccountType value, kept in sync
+        # with the primary index
+        self._accounts: List[Dict[str, Account]] = [{} for _ in AccountType]
 
     def __len__(self):
         """Return the total number of accounts under management"""
-        return sum([len(self._accounts[acc_type]) for acc_type in self._accounts])
+        return len(self._index)
 
     def _convert_account_type(
         self, account_type: Union[AccountType, str]
@@ -147,28 +319,38 @@ class ChartOfAccounts:
             return account_type
 
         if isinstance(account_type, str):
-            try:
-                return AccountType[account_type.upper()]
-            except KeyError:
-                ...
+            cast_account_type = _ACCOUNT_TYPE_MAP.get(account_type)
+            if cast_account_type is not None:
+                return cast_account_type
+            return _to_account_type(account_type)
         return None
 
     @property
-    def accounts(self):
-        return self._accounts
+    def accounts(self) -> Mapping[str, Mapping[str, Account]]:
+        """A read-only mapping of the accounts by type, keyed by the account type name
+
+        Use add_account/remove_account to change the chart"""
+        return MappingProxyType(
+            {
+                act_type.name: MappingProxyType(self._accounts[act_type])
+                for act_type in AccountType
+            }
+        )
 
     def add_account(self, account: Account):
         """Add an instantiated account to the chart"""
-        if isinstance(account, Account):
-            self._accounts[account.account_type.name][account.name] = account
+        if type(account) in _ACCOUNT_TYPES or isinstance(account, Account):
+            account_type = account.account_type
+            self._index[(account_type, account.name)] = account
+            self._accounts[account_type][account.name] = account
 
     def remove_account(self, account: Account):
         """Remove an account from the chart"""
-        if not isinstance(account, Account):
+        if type(account) not in _ACCOUNT_TYPES and not isinstance(account, Account):
             return
-        accounts = self.by_type(account.account_type)
-        if accounts and account.name in accounts:
-            del self._accounts[account.account_type.name][account.name]
+        account_type = account.account_type
+        if self._index.pop((account_type, account.name), None) is not None:
+            del self._accounts[account_type][account.name]
 
     def _create_account(self, acc_cls: Type[Account], name: str, balance: float = 0.0):
         account = acc_cls(name, balance)
@@ -204,7 +386,7 @@ class ChartOfAccounts:
         """Create and add a new account from its constructor parameters and add return it"""
 
         cast_account_type = self._convert_account_type(account_type)
-        if not cast_account_type:
+        if cast_account_type is None:
             return None
 
         account = accounts_by_type[cast_account_type](
@@ -215,17 +397,19 @@ class ChartOfAccounts:
 
     def has_account(self, account: Account) -> bool:
         """Method to see whether an instantiated account is present in the coa"""
-        return account.name in self._accounts[account.account_type.name]
+        return (account.account_type, account.name) in self._index
 
     def by_type(
         self, account_type: Union[AccountType, str]
-    ) -> Optional[Dict[str, Account]]:
-        """Returns a dict of accounts with a given account type.
+    ) -> Optional[Mapping[str, Account]]:
+        """Returns a read-only mapping of accounts with a given account type.
 
         You can pass an AccountType directly, or a string of the account type"""
 
         cast_account_type = self._convert_account_type(account_type)
-        return self._accounts[cast_account_type.name] if cast_account_type else None
+        if cast_account_type is None:
+            return None
+        return MappingProxyType(self._accounts[cast_account_type])
 
     def by_name_and_type(
         self,
@@ -233,17 +417,57 @@ class ChartOfAccounts:
         account_type: Union[AccountType, str],
     ) -> Optional[Account]:
         """Look for an account by its name and type, return it if found, None otherwise"""
-        accounts = self.by_type(account_type)
-        return accounts.get(account_name, None) if accounts else None
+        cast_account_type = self._convert_account_type(account_type)
+        if cast_account_type is None:
+            return None
+        return self._index.get((cast_account_type, account_name), None)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TransactionItem:
-    """Object to store relevant transaction item data"""
+    """Object to store relevant transaction item data.
+
+    Frozen, so the running totals of a transaction cannot drift from its items"""
 
     account: Account
     amount: float
 
+    def __post_init__(self):
+        # Cast once here so posting can trust the amount is a float
+        object.__setattr__(self, "amount", float(self.amount))
+
+
+def post_many(
+    debits: Iterable[TransactionItem], credits: Iterable[TransactionItem]
+) -> None:
+    """Post a batch of debit and credit items to their accounts.
+
+    Items are netted per account first, so each account balance is only
+    written once regardless of how many entries target it.  Accounts without a
+    known debit sign, or with their own debit/credit methods, are posted item by
+    item through debit()/credit() instead"""
+
+    net: Dict[Account, float] = {}
+
+    # Credits are applied before debits, as balance dependent debit()/credit()
+    # overrides rely on that order
+    for item in credits:
+        account = item.account
+        if account.debit_sign is None:
+            account.credit(item.amount)
+        else:
+            net[account] = net.get(account, 0.0) - item.amount
+
+    for item in debits:
+        account = item.account
+        if account.debit_sign is None:
+            account.debit(item.amount)
+        else:
+            net[account] = net.get(account, 0.0) + item.amount
+
+    for account, delta in net.items():
+        account._balance += account.debit_sign * delta
+
 
 class Transaction(Event):
     """A transaction event to manage accounting transactions between accounts
@@ -251,29 +475,49 @@ class Transaction(Event):
     A transaction consists of both debits and credits.  Each debit/credit item
     belongs to an account and an amount"""
 
+    __slots__ = ("_debits", "_credits", "_debit_sum", "_credit_sum")
+
     def __init__(self, timestep: int, name: str):
         super().__init__(timestep, name)
-        self.clear()
+        self._debits: List[TransactionItem] = []
+        self._credits: List[TransactionItem] = []
+
+        # Running totals, kept in step with the items added
+        self._debit_sum = 0.0
+        self._credit_sum = 0.0
 
     def clear(self):
         """Clears the current transaction of all debits and credits"""
-        self._debits: List[TransactionItem] = []
-        self._credits: List[TransactionItem] = []
+        # Empty the lists in place rather than allocating new ones
+        self._debits.clear()
+        self._credits.clear()
+        self._debit_sum = 0.0
+        self._credit_sum = 0.0
 
     @property
-    def debits(self):
-        """The debits stored in this transaction"""
+    def debits(self) -> List[TransactionItem]:
+        """The debits stored in this transaction.
+
+        Treat as read-only, use add_debit to add more so the totals stay in step"""
         return self._debits
 
     @property
-    def credits(self):
-        """The credits stored in this transaction"""
+    def credits(self) -> List[TransactionItem]:
+        """The credits stored in this transaction.
+
+        Treat as read-only, use add_credit to add more so the totals stay in step"""
         return self._credits
 
     @property
     def is_balanced(self) -> bool:
         """A boolean property indicating whether the current transaction is balanced"""
-        return self.total_credits == self.total_debits
+        # Compared with a tolerance, as float sums of equal amounts can differ slightly
+        return math.isclose(
+            self._credit_sum,
+            self._debit_sum,
+            rel_tol=_BALANCE_TOLERANCE,
+            abs_tol=_BALANCE_TOLERANCE,
+        )
 
     @property
     def n_entries(self) -> int:
@@ -283,48 +527,52 @@ class Transaction(Event):
     @property
     def total_debits(self) -> float:
         """A float property of the total amount of debits in the transaction"""
-        return sum([i.amount for i in self._debits])
+        return self._debit_sum
 
     @property
     def total_credits(self) -> float:
         """A float property of the total amount of credits in the transaction"""
-        return sum([i.amount for i in self._credits])
+        return self._credit_sum
+
+    def add_debit_item(self, item: TransactionItem):
+        """Adds a TransactionItem to the debits, without validating it"""
+        self._debits.append(item)
+        self._debit_sum += item.amount
+
+    def add_debit_account(self, account: Account, amount: N):
+        """Adds a debit of an amount to an account, without validating it"""
+        self.add_debit_item(TransactionItem(account, amount))
+
+    def add_credit_item(self, item: TransactionItem):
+        """Adds a TransactionItem to the credits, without validating it"""
+        self._credits.append(item)
+        self._credit_sum += item.amount
+
+    def add_credit_account(self, account: Account, amount: N):
+        """Adds a credit of an amount to an account, without validating it"""
+        self.add_credit_item(TransactionItem(account, amount))
 
     def add_debit(self, item: Union[Account, TransactionItem], amount: float = None):
-        """Adds a TransactionItem to the debits"""
+        """Adds a TransactionItem, or an account and amount, to the debits"""
         if isinstance(item, Account):
-            if amount is None:
-                return
-            trans_item = TransactionItem(item, amount)
+            if amount is not None:
+                self.add_debit_account(item, amount)
         elif isinstance(item, TransactionItem):
-            trans_item = item
-        else:
-            return
-
-        self._debits.append(trans_item)
+            self.add_debit_item(item)
 
     def add_credit(self, item: Union[Account, TransactionItem], amount: float = None):
-        """Adds a TransactionItem to the credits"""
+        """Adds a TransactionItem, or an account and amount, to the credits"""
         if isinstance(item, Account):
-            if amount is None:
-                return
-            trans_item = TransactionItem(item, amount)
+            if amount is not None:
+                self.add_credit_account(item, amount)
         elif isinstance(item, TransactionItem):
-            trans_item = item
-        else:
-            return
-
-        self._credits.append(trans_item)
+            self.add_credit_item(item)
 
     def call(self, *args):
         """Executes the transaction, applying credits and debits to accounts"""
         if not self.is_balanced:
             return
 
-        for item in self._credits:
-            item.account.credit(item.amount)
-
-        for item in self._debits:
-            item.account.debit(item.amount)
+        post_many(self._debits, self._credits)
 
         yield None
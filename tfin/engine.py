@@ -1,11 +1,20 @@
 """The core event-based simulation engine"""
 import heapq
+import sys
 from abc import abstractmethod
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Iterator, List, NamedTuple, Optional, Protocol, runtime_checkable
-
-# from .event import EventError, EventLike, StopEngineError
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum, auto
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+)
 
 __all__ = [
     "Engine",
@@ -14,6 +23,9 @@ __all__ = [
     "EngineStatus",
     "Event",
     "EventError",
+    "EventQueue",
+    "SimContext",
+    "STOP",
     "StopEngineError",
 ]
 
@@ -31,7 +43,7 @@ class EngineError(Exception):  # pragma: no cover
         return f"{self.now}: {self.message}"
 
 
-class EngineState(Enum):
+class EngineState(IntEnum):
     """Enumeration of allowed engine states"""
 
     WAITING = auto()  # Initial state of a fresh simulation
@@ -61,7 +73,19 @@ class StopEngineError(EventError):
     """Raised by Events to indicate that the simulation should be aborted"""
 
 
-@runtime_checkable
+class _StopSentinel:
+    """Type of the `STOP` sentinel"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "STOP"
+
+
+# Yielded by Events to cleanly stop the simulation without raising an exception
+STOP = _StopSentinel()
+
+
 class EventLike(Protocol):
     """An Event like interface to use in typing"""
 
@@ -73,32 +97,131 @@ class EventLike(Protocol):
         """Executes the event callback"""
 
 
+@dataclass
+class SimContext:
+    """The simulation context the engine passes to every event call.
+
+    Slotted so events read its fields as attributes rather than dict lookups"""
+
+    __slots__ = ("time", "engine", "state")
+
+    time: int  # The current simulation timestep
+    engine: "Engine"  # The engine running the simulation
+    state: dict  # Free-form simulation state shared between events
+
+
+def _is_event_like(obj) -> bool:
+    """Whether an object can be scheduled as an event.
+
+    A nominal check first, with a duck-typed fallback for other EventLike objects"""
+    return isinstance(obj, Event) or (
+        hasattr(obj, "timestep") and hasattr(obj, "name") and hasattr(obj, "call")
+    )
+
+
 class Event:
     """The core Event object"""
 
-    def __init__(self, timestep: int, name: str, data: dict = {}):
+    __slots__ = ("timestep", "name", "_data")
+
+    def __init__(self, timestep: int, name: str, data: Optional[dict] = None):
         self.timestep = timestep
-        self.name = name
-        self.data = data
+        # Event names come from a small vocabulary, so share one string per name
+        self.name = sys.intern(name) if type(name) is str else name
+        self._data = data
+
+    @property
+    def data(self) -> dict:
+        """The event data, allocated on first access for events created without any"""
+        if self._data is None:
+            self._data = {}
+        return self._data
 
-    def call(self, ctx: dict = {}) -> Iterator[Optional["Event"]]:
+    @data.setter
+    def data(self, data: dict):
+        self._data = data
+
+    def __lt__(self, other: "Event") -> bool:
+        """Events order by their timestep"""
+        return self.timestep < other.timestep
+
+    def call(self, ctx: Optional[SimContext] = None) -> Iterable[Optional["Event"]]:
         """The event callback function.
 
         This is the business end of the event.  It's job is to decide from the context which events to fire and when.
 
         The function yields events until exhausted.  The engine will consume all yielded events and execute them in
-        the order they are yielded.
+        the order they are yielded.  Events that fan out many children at once may instead return them as a list,
+        which the engine schedules as a single batch without resuming a generator per event.
+        Yielding `STOP` stops the simulation cleanly without raising `StopEngineError`.
 
-        The engine will pass a yet ill-defined simulation context dictionary that should contain all relevant context
-        objects an event would need
+        The engine passes its `SimContext`, holding the current time, the engine itself and the shared simulation
+        state
         """
         yield None
 
 
-@dataclass(order=True)
-class QueueItem:
-    timestep: int
-    event: EventLike = field(compare=False)
+class EventQueue:
+    """A priority queue of events bucketed by their integer timestep.
+
+    Events sharing a timestep are appended to a FIFO bucket, so only distinct timesteps
+    go through the heap.  Bursts of events at the same timestep are pushed and popped in
+    O(1) and are returned in the order they were scheduled"""
+
+    def __init__(self):
+        self._timesteps: List[int] = []  # Heap of the distinct pending timesteps
+        self._buckets: Dict[int, Deque[EventLike]] = {}
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def push(self, timestep: int, event: EventLike) -> None:
+        """Add an event to the queue at a timestep"""
+        bucket = self._buckets.get(timestep)
+        if bucket is None:
+            bucket = self._buckets[timestep] = deque()
+            heapq.heappush(self._timesteps, timestep)
+        bucket.append(event)
+        self._len += 1
+
+    def push_many(self, items: Iterable[Tuple[int, EventLike]]) -> None:
+        """Add several (timestep, event) pairs to the queue in one batch.
+
+        New timesteps are merged into the heap with a single heapify when that is cheaper
+        than pushing them one by one"""
+        new_timesteps = []
+        for timestep, event in items:
+            bucket = self._buckets.get(timestep)
+            if bucket is None:
+                bucket = self._buckets[timestep] = deque()
+                new_timesteps.append(timestep)
+            bucket.append(event)
+            self._len += 1
+
+        n_heap, n_new = len(self._timesteps), len(new_timesteps)
+        if n_new * (n_heap + n_new).bit_length() > n_heap + n_new:
+            self._timesteps.extend(new_timesteps)
+            heapq.heapify(self._timesteps)
+        else:
+            for timestep in new_timesteps:
+                heapq.heappush(self._timesteps, timestep)
+
+    def peek(self) -> Tuple[int, EventLike]:
+        """Return the next (timestep, event) pair without removing it"""
+        timestep = self._timesteps[0]
+        return timestep, self._buckets[timestep][0]
+
+    def pop(self) -> Tuple[int, EventLike]:
+        """Remove and return the next (timestep, event) pair"""
+        timestep = self._timesteps[0]
+        bucket = self._buckets[timestep]
+        event = bucket.popleft()
+        if not bucket:
+            heapq.heappop(self._timesteps)
+            del self._buckets[timestep]
+        self._len -= 1
+        return timestep, event
 
 
 @dataclass
@@ -111,8 +234,8 @@ class Engine:
     name: str = "Unnamed"  # The name of this engine
 
     def __post_init__(self):
-        self.now = 0
-        self.queue: List[QueueItem] = []
+        self.context = SimContext(time=0, engine=self, state={})
+        self.queue = EventQueue()
         self._status: EngineStatus = EngineStatus(
             state=EngineState.WAITING,
             message="Initialized",
@@ -121,6 +244,15 @@ class Engine:
     def __str__(self):
         return f"Engine({self.name}) - {len(self.queue)} events - Status: '{self.state.name}'"
 
+    @property
+    def now(self) -> int:
+        """The current simulation timestep, held by the simulation context"""
+        return self.context.time
+
+    @now.setter
+    def now(self, timestep: int):
+        self.context.time = timestep
+
     @property
     def status(self):
         """The status of the engine holds an `EngineStatus` object comprising of the current engine state and a message"""
@@ -142,14 +274,20 @@ class Engine:
 
     def is_state(self, state: EngineState) -> bool:
         """Returns whether the current engine state evaluates to the provided one"""
-        return self.state == state
+        return self._status.state == state
 
     def schedule(self, event: EventLike, timestep: int = None) -> None:
         """Schedule an event to the queue"""
 
-        if isinstance(event, EventLike):
+        if _is_event_like(event):
             timestep = timestep or event.timestep
-            heapq.heappush(self.queue, QueueItem(timestep, event))
+            self.queue.push(timestep, event)
+
+    def schedule_many(self, events: Iterable[EventLike]) -> None:
+        """Schedule several events to the queue in one batch, at their own timesteps"""
+        self.queue.push_many(
+            (event.timestep, event) for event in events if _is_event_like(event)
+        )
 
     def stop(self, msg: str) -> None:
         """Stops the engine with a message"""
@@ -174,30 +312,40 @@ class Engine:
             EngineState.RUNNING, f"Stopping at {stop_at if stop_at else 'Never'}"
         )
 
+        # Bound locally to save attribute lookups on every iteration
+        context = self.context
+        queue = self.queue
+        pop = queue.pop
+        consume_event = self.consume_event
+
         while True:
-            if not self.queue:
+            if not queue:
                 self.finish(f"Simulation finished at {self.now}")
                 return
 
-            queue_item = heapq.heappop(self.queue)
-            timestep = queue_item.timestep
-            event = queue_item.event
+            timestep, event = pop()
             if stop_at is not None and timestep > stop_at:
                 self.now = stop_at
                 self.stop(f"Simulation max time {stop_at} exceeded")
                 return
             else:
-                self.now = timestep
+                context.time = timestep
 
-            if not self.consume_event(event):
+            if not consume_event(event):
                 return
 
     def consume_event(self, event: EventLike):
         """Processes an event, checks for errors and schedules any events that are yielded"""
+        new_events = []
         try:
-            for evt in event.call():
+            for evt in event.call(self.context):
+                if evt is STOP:
+                    self.stop(
+                        f"Simulation was stopped by event {event.name} at t {self.now}"
+                    )
+                    return False
                 if evt:
-                    self.schedule(evt)
+                    new_events.append(evt)
 
         except StopEngineError as e:
             self.stop(
@@ -209,3 +357,6 @@ class Engine:
             )
         else:
             return True
+        finally:
+            # Events yielded before any error or STOP are still scheduled
+            self.schedule_many(new_events)